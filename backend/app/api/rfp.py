@@ -311,6 +311,10 @@ def _stmt_uses_names(stmt: ast.stmt, names: set[str]) -> bool:
     return False
 
 
+def _stmt_loaded_names(stmt: ast.stmt) -> set[str]:
+    return {node.id for node in ast.walk(stmt) if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load)}
+
+
 def _has_call(stmt: ast.stmt, owner: str | None, attr: str) -> bool:
     for node in ast.walk(stmt):
         if not isinstance(node, ast.Call):
@@ -345,15 +349,19 @@ def _extract_savefig_target(stmt: ast.stmt) -> str | None:
         if not isinstance(node, ast.Call):
             continue
         func = node.func
-        if not (
+        if isinstance(func, ast.Name) and func.id == "save_chart":
+            target_index = 1
+        elif (
             isinstance(func, ast.Attribute)
             and isinstance(func.value, ast.Name)
-            and func.value.id == "plt"
+            and func.value.id in {"plt", "fig"}
             and func.attr == "savefig"
         ):
+            target_index = 0
+        else:
             continue
-        if node.args:
-            first = node.args[0]
+        if len(node.args) > target_index:
+            first = node.args[target_index]
             if isinstance(first, ast.Constant) and isinstance(first.value, str):
                 return first.value
             if isinstance(first, ast.Name):
@@ -374,6 +382,38 @@ def _slice_statement_block(lines: list[str], statements: list[ast.stmt], start_i
     return "\n".join(lines[start_line - 1:end_line]).rstrip()
 
 
+def _slice_statement_indexes(lines: list[str], statements: list[ast.stmt], indexes: list[int]) -> str:
+    """Slice a non-contiguous set of statements, keeping each contiguous run intact."""
+    runs: list[list[int]] = []
+    for stmt_idx in sorted(indexes):
+        if runs and runs[-1][1] == stmt_idx - 1:
+            runs[-1][1] = stmt_idx
+        else:
+            runs.append([stmt_idx, stmt_idx])
+    return "\n".join(_slice_statement_block(lines, statements, start, end) for start, end in runs)
+
+
+def _extend_start_with_dependencies(
+    statements: list[ast.stmt],
+    start_idx: int,
+    end_idx: int,
+    used_indexes: set[int],
+) -> int:
+    """Move a snippet's start back over directly preceding assignments that the block reads."""
+    needed_names: set[str] = set()
+    for look_idx in range(start_idx, end_idx + 1):
+        needed_names.update(_stmt_loaded_names(statements[look_idx]))
+    while start_idx > 0 and start_idx - 1 not in used_indexes:
+        prev_stmt = statements[start_idx - 1]
+        if not isinstance(prev_stmt, ast.Assign) or _is_doc_add_table_assign(prev_stmt):
+            break
+        if _is_mermaid_code_assign(prev_stmt) or not _extract_assigned_names(prev_stmt) & needed_names:
+            break
+        start_idx -= 1
+        needed_names.update(_stmt_loaded_names(prev_stmt))
+    return start_idx
+
+
 def _is_doc_add_table_assign(stmt: ast.stmt) -> str | None:
     if not isinstance(stmt, ast.Assign) or len(stmt.targets) != 1:
         return None
@@ -391,6 +431,8 @@ def _is_doc_add_table_assign(stmt: ast.stmt) -> str | None:
         and func.attr == "add_table"
     ):
         return target.id
+    if isinstance(func, ast.Name) and func.id == "add_data_table":
+        return target.id
     return None
 
 
@@ -430,10 +472,144 @@ def _is_mermaid_code_assign(stmt: ast.stmt) -> str | None:
     return None
 
 
+def _extract_mermaid_batch_outputs(stmt: ast.stmt) -> list[tuple[str, str]]:
+    """Return the (code variable, output filename) pairs passed to render_mermaid_batch."""
+    for node in ast.walk(stmt):
+        if not isinstance(node, ast.Call):
+            continue
+        if not isinstance(node.func, ast.Name) or node.func.id != "render_mermaid_batch":
+            continue
+        if not node.args or not isinstance(node.args[0], (ast.List, ast.Tuple)):
+            return []
+        outputs: list[tuple[str, str]] = []
+        for item in node.args[0].elts:
+            if not isinstance(item, (ast.Tuple, ast.List)) or len(item.elts) < 2:
+                continue
+            code_arg, name_arg = item.elts[0], item.elts[1]
+            if (
+                isinstance(code_arg, ast.Name)
+                and isinstance(name_arg, ast.Constant)
+                and isinstance(name_arg.value, str)
+            ):
+                outputs.append((code_arg.id, name_arg.value))
+        return outputs
+    return []
+
+
+def _split_mermaid_batch(
+    statements: list[ast.stmt],
+    start_idx: int,
+    end_idx: int,
+) -> list[tuple[str, list[int]]]:
+    """Split a render_mermaid_batch block into (output filename, statement indexes) per diagram.
+
+    Returns an empty list when the batch results are not unpacked into one name per diagram.
+    """
+    for batch_idx in range(start_idx, end_idx + 1):
+        outputs = _extract_mermaid_batch_outputs(statements[batch_idx])
+        if outputs:
+            break
+    else:
+        return []
+
+    batch_stmt = statements[batch_idx]
+    if not isinstance(batch_stmt, ast.Assign) or len(batch_stmt.targets) != 1:
+        return []
+    target = batch_stmt.targets[0]
+    if not isinstance(target, (ast.Tuple, ast.List)) or len(target.elts) != len(outputs):
+        return []
+    if not all(isinstance(elt, ast.Name) for elt in target.elts):
+        return []
+
+    code_indexes = {
+        _is_mermaid_code_assign(statements[look_idx]): look_idx for look_idx in range(start_idx, batch_idx)
+    }
+    diagrams: list[tuple[str, list[int]]] = []
+    owners: dict[str, list[int]] = {}
+    for (code_var, output_name), path_var in zip(outputs, target.elts):
+        indexes = [code_indexes[code_var]] if code_var in code_indexes else []
+        indexes.append(batch_idx)
+        diagrams.append((output_name, indexes))
+        owners[path_var.id] = indexes
+
+    # Statements after the batch call belong to the diagram whose path they use; captions and
+    # other follow-up lines stay with the diagram inserted just before them.
+    current: list[int] | None = None
+    for look_idx in range(batch_idx + 1, end_idx + 1):
+        for path_var, indexes in owners.items():
+            if _stmt_uses_names(statements[look_idx], {path_var}):
+                current = indexes
+                break
+        if current is not None:
+            current.append(look_idx)
+    return diagrams
+
+
+def _collect_mermaid_future_uses(
+    statements: list[ast.stmt],
+    end_idx: int,
+    future_vars: set[str],
+) -> list[int]:
+    """Return the indexes of later statements that collect a submit_mermaid future.
+
+    The future is usually resolved where the picture is inserted, after other content;
+    a caption directly after such a statement is kept with it.
+    """
+    future_vars = set(future_vars)
+    indexes: list[int] = []
+    look_idx = end_idx + 1
+    while look_idx < len(statements):
+        candidate = statements[look_idx]
+        if _stmt_loaded_names(candidate) & future_vars:
+            indexes.append(look_idx)
+            future_vars.update(_extract_assigned_names(candidate))
+            next_idx = look_idx + 1
+            if next_idx < len(statements) and (
+                _has_call(statements[next_idx], None, "add_caption")
+                or _has_call(statements[next_idx], None, "add_figure_caption")
+            ):
+                indexes.append(next_idx)
+                look_idx = next_idx
+        elif _extract_assigned_names(candidate) & future_vars:
+            # The name now holds a different render.
+            break
+        look_idx += 1
+    return indexes
+
+
+def _creates_figure(stmt: ast.stmt) -> bool:
+    return (
+        _has_call(stmt, "plt", "figure")
+        or _has_call(stmt, "plt", "subplots")
+        or _has_call(stmt, None, "chart_subplots")
+    )
+
+
+def _extract_chart_call_name(stmt: ast.stmt, func_name: str) -> str | None:
+    """Return the image name passed to a call of a chart helper, falling back to its first string argument."""
+    for node in ast.walk(stmt):
+        if not isinstance(node, ast.Call):
+            continue
+        if not isinstance(node.func, ast.Name) or node.func.id != func_name:
+            continue
+        values = [
+            arg.value
+            for arg in [*node.args, *(keyword.value for keyword in node.keywords)]
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, str)
+        ]
+        for value in values:
+            if value.lower().endswith(".png"):
+                return Path(value).stem
+        return values[0] if values else None
+    return None
+
+
 def _is_chart_start(statements: list[ast.stmt], idx: int) -> bool:
     stmt = statements[idx]
     if _has_call(stmt, "sns", "set_style") or _has_call(stmt, "plt", "figure") or _has_call(stmt, "plt", "subplots"):
         return True
+    if _has_call(stmt, None, "chart_subplots"):
+        return True
     if _has_call(stmt, "sns", "barplot") or _has_call(stmt, "sns", "lineplot") or _has_call(stmt, "sns", "scatterplot"):
         return True
     if _has_call(stmt, "sns", "heatmap") or _has_call(stmt, "sns", "histplot") or _has_call(stmt, "sns", "boxplot"):
@@ -475,31 +651,71 @@ def _build_code_package(document_code: str) -> GeneratedCodePackage:
     lines = document_code.splitlines()
 
     mermaid_items: list[GeneratedCodeSnippet] = []
+    grouped_indexes: set[int] = set()
     for idx, stmt in enumerate(statements):
+        if idx in grouped_indexes:
+            continue
         mermaid_var = _is_mermaid_code_assign(stmt)
         if not mermaid_var:
             continue
 
         end_idx = idx
         block_vars = {mermaid_var}
+        future_vars: set[str] = set()
         output_name: str | None = None
         for look_idx in range(idx + 1, len(statements)):
             candidate = statements[look_idx]
+            grouped_var = _is_mermaid_code_assign(candidate)
+            if grouped_var:
+                # Consecutive diagram definitions are rendered together via render_mermaid_batch.
+                if end_idx != look_idx - 1 or any(
+                    not _is_mermaid_code_assign(statements[prev]) for prev in range(idx, look_idx)
+                ):
+                    break
+                block_vars.add(grouped_var)
+                grouped_indexes.add(look_idx)
+                end_idx = look_idx
+                continue
             if _stmt_uses_names(candidate, block_vars):
                 block_vars.update(_extract_assigned_names(candidate))
-                output_name = output_name or _extract_call_string_arg(candidate, "render_mermaid", 1)
+                if _has_call(candidate, None, "submit_mermaid"):
+                    future_vars.update(_extract_assigned_names(candidate))
+                output_name = (
+                    output_name
+                    or _extract_call_string_arg(candidate, "render_mermaid", 1)
+                    or _extract_call_string_arg(candidate, "submit_mermaid", 1)
+                )
                 end_idx = look_idx
                 continue
-            if _has_call(candidate, None, "add_caption") and end_idx > idx:
+            if (
+                _has_call(candidate, None, "add_caption") or _has_call(candidate, None, "add_figure_caption")
+            ) and end_idx > idx:
                 end_idx = look_idx
+                continue
             break
 
+        batch_diagrams = _split_mermaid_batch(statements, idx, end_idx)
+        for batch_output, batch_indexes in batch_diagrams:
+            mermaid_items.append(
+                GeneratedCodeSnippet(
+                    snippet_id=f"mermaid_{len(mermaid_items) + 1}",
+                    title=batch_output.replace("_", " ").strip().title(),
+                    code=_slice_statement_indexes(lines, statements, batch_indexes),
+                )
+            )
+        if batch_diagrams:
+            continue
+
+        block_indexes = list(range(idx, end_idx + 1))
+        if future_vars:
+            block_indexes.extend(_collect_mermaid_future_uses(statements, end_idx, future_vars))
+
         title = output_name or mermaid_var
         mermaid_items.append(
             GeneratedCodeSnippet(
                 snippet_id=f"mermaid_{len(mermaid_items) + 1}",
                 title=title.replace("_", " ").strip().title(),
-                code=_slice_statement_block(lines, statements, idx, end_idx),
+                code=_slice_statement_indexes(lines, statements, block_indexes),
             )
         )
 
@@ -514,22 +730,75 @@ def _build_code_package(document_code: str) -> GeneratedCodePackage:
         for look_idx in range(idx + 1, len(statements)):
             candidate = statements[look_idx]
             if not _stmt_uses_names(candidate, block_vars):
-                break
+                # Keep row data assigned between table statements (e.g. `rows = [...]`
+                # followed by `add_table_rows(table, rows)`) inside the table block.
+                assigned = _extract_assigned_names(candidate)
+                next_stmt = statements[look_idx + 1] if look_idx + 1 < len(statements) else None
+                if not (
+                    assigned
+                    and next_stmt is not None
+                    and _stmt_uses_names(next_stmt, block_vars)
+                    and _stmt_uses_names(next_stmt, assigned)
+                ):
+                    break
             block_vars.update(_extract_assigned_names(candidate))
             end_idx = look_idx
 
+        start_idx = _extend_start_with_dependencies(statements, idx, end_idx, set())
         table_items.append(
             GeneratedCodeSnippet(
                 snippet_id=f"table_{len(table_items) + 1}",
                 title=table_var.replace("_", " ").strip().title(),
-                code=_slice_statement_block(lines, statements, idx, end_idx),
+                code=_slice_statement_block(lines, statements, start_idx, end_idx),
             )
         )
 
     chart_items: list[GeneratedCodeSnippet] = []
     used_chart_indexes: set[int] = set()
+    chart_functions: dict[str, int] = {}
     idx = 0
     while idx < len(statements):
+        stmt = statements[idx]
+        if isinstance(stmt, ast.FunctionDef) and _is_chart_start(statements, idx):
+            # A chart helper has no data of its own; each call site becomes a chart together with the def.
+            chart_functions[stmt.name] = idx
+            used_chart_indexes.add(idx)
+            idx += 1
+            continue
+
+        function_name = next(
+            (name for name in chart_functions if idx not in used_chart_indexes and _has_call(stmt, None, name)),
+            None,
+        )
+        if function_name:
+            def_idx = chart_functions[function_name]
+            start_idx = _extend_start_with_dependencies(statements, idx, idx, used_chart_indexes)
+            end_idx = idx
+            next_idx = idx + 1
+            if next_idx < len(statements) and (
+                _has_call(statements[next_idx], None, "add_caption")
+                or _has_call(statements[next_idx], None, "add_figure_caption")
+            ):
+                end_idx = next_idx
+            for used_idx in range(start_idx, end_idx + 1):
+                used_chart_indexes.add(used_idx)
+
+            chart_title = _extract_chart_call_name(stmt, function_name)
+            chart_items.append(
+                GeneratedCodeSnippet(
+                    snippet_id=f"diagram_{len(chart_items) + 1}",
+                    title=(chart_title or f"Chart {len(chart_items) + 1}").replace("_", " ").strip().title(),
+                    code="\n\n".join(
+                        [
+                            _slice_statement_block(lines, statements, def_idx, def_idx),
+                            _slice_statement_block(lines, statements, start_idx, end_idx),
+                        ]
+                    ),
+                )
+            )
+            idx = end_idx + 1
+            continue
+
         if idx in used_chart_indexes or not _is_chart_start(statements, idx):
             idx += 1
             continue
@@ -550,13 +819,21 @@ def _build_code_package(document_code: str) -> GeneratedCodePackage:
             break
 
         close_idx: int | None = None
+        # Plot calls (sns.lineplot, ...) also mark chart starts; only a second figure ends the block.
+        seen_figure = _creates_figure(statements[idx])
         for look_idx in range(idx, len(statements)):
             candidate = statements[look_idx]
-            if look_idx > idx and _is_chart_start(statements, look_idx):
-                break
+            if look_idx > idx and _creates_figure(candidate):
+                if seen_figure:
+                    break
+                seen_figure = True
             if _is_doc_add_table_assign(candidate) or _is_mermaid_code_assign(candidate):
                 break
-            if _has_call(candidate, "plt", "close"):
+            if (
+                _has_call(candidate, "plt", "close")
+                or _has_call(candidate, "fig", "savefig")
+                or _has_call(candidate, None, "save_chart")
+            ):
                 close_idx = look_idx
                 break
 
@@ -564,6 +841,9 @@ def _build_code_package(document_code: str) -> GeneratedCodePackage:
             idx += 1
             continue
 
+        # Pull in earlier data assignments the chart depends on (e.g. schedule lists/arrays).
+        start_idx = _extend_start_with_dependencies(statements, start_idx, close_idx, used_chart_indexes)
+
         end_idx = close_idx
         chart_title: str | None = None
         for look_idx in range(start_idx, close_idx + 1):
@@ -575,7 +855,13 @@ def _build_code_package(document_code: str) -> GeneratedCodePackage:
 
         for look_idx in range(close_idx + 1, min(close_idx + 5, len(statements))):
             candidate = statements[look_idx]
-            if _has_call(candidate, "doc", "add_picture") or _has_call(candidate, None, "add_caption"):
+            if isinstance(candidate, ast.FunctionDef):
+                break
+            if _has_call(candidate, None, "add_caption") or _has_call(candidate, None, "add_figure_caption"):
+                # The caption closes the figure; later statements reusing its data belong elsewhere.
+                end_idx = look_idx
+                break
+            if _has_call(candidate, "doc", "add_picture") or _has_call(candidate, "plt", "close"):
                 end_idx = look_idx
                 block_vars.update(_extract_assigned_names(candidate))
                 continue
@@ -620,13 +906,26 @@ def _extract_png_names_from_code(code: str) -> list[str]:
 
 def _extract_mermaid_output_filename(code: str) -> Optional[str]:
     mermaid_call = re.search(
-        r"render_mermaid\s*\(\s*.+?,\s*['\"]([^'\"]+)['\"]",
+        r"(?:render|submit)_mermaid\s*\(\s*.+?,\s*['\"]([^'\"]+)['\"]",
         code,
         flags=re.IGNORECASE | re.DOTALL,
     )
-    if not mermaid_call:
+    if mermaid_call:
+        return f"{Path(mermaid_call.group(1)).name}.png"
+
+    # render_mermaid_batch snippets carry the whole batch call; pick the diagram defined in the snippet.
+    try:
+        statements = ast.parse(code).body
+    except SyntaxError:
         return None
-    return f"{Path(mermaid_call.group(1)).name}.png"
+    assigned_names: set[str] = set()
+    for stmt in statements:
+        assigned_names.update(_extract_assigned_names(stmt))
+    for stmt in statements:
+        for code_var, output_name in _extract_mermaid_batch_outputs(stmt):
+            if code_var in assigned_names:
+                return f"{Path(output_name).name}.png"
+    return None
 
 
 def _collect_png_assets(image_dir: Path) -> dict[str, tuple[str, str]]:
@@ -108,24 +108,31 @@ The code runs in an environment with:
 - `WD_TABLE_ALIGNMENT`: From docx.enum.table
 - `plt`, `sns`, `np`, `pd`: matplotlib.pyplot, seaborn, numpy, pandas
 - `render_mermaid(code, filename)`: Helper to render mermaid diagrams to PNG
+- `render_mermaid_batch([(code, filename), ...])`: Renders several mermaid diagrams concurrently
+- `submit_mermaid(code, filename)`: Starts a mermaid render in the background; `.result()` gives the path
+- `add_paragraphs(doc, texts, style=None)`: Appends several paragraphs in one batch
+- `add_section(doc, title, level=1, paragraphs=(), style=None, page_break=False)`: Adds an optional page break,
+  a heading and its opening paragraphs in one batch
+- `add_data_table(doc, headers, rows)`: Adds a table with a bold header row and all data rows
+- `add_table_rows(table, rows)`: Appends data rows to a table in one batch
+- `set_header_cells(cells, texts)`: Writes bold header texts into a table's first row
+- `bold_cells(cells)`: Bolds existing text in cells
+- `chart_subplots(figsize)`: Returns a reusable `(fig, ax)` pair for charts
+- `PT0`, `PT6`, `PT9`..`PT24`, `FIGURE_WIDTH`, `WIDE_FIGURE_WIDTH`, `CENTER`: Precomputed sizes and alignment
+- `save_chart(fig, path)`: Saves a chart PNG (100 dpi, fast encoding) and returns it for `doc.add_picture`
 
-## Creating Charts with Seaborn
+## Creating Charts
 ```python
-# Create a chart
-import matplotlib.pyplot as plt
-import seaborn as sns
-
-plt.figure(figsize=(8, 5))
-sns.set_style("whitegrid")
-data = {'Phase': ['Discovery', 'Design', 'Implementation', 'Testing'], 'Weeks': [2, 4, 8, 3]}
-sns.barplot(x='Phase', y='Weeks', data=data, palette='Blues_d')
-plt.title('Project Timeline')
-plt.tight_layout()
+# Create a chart on the shared figure (no plt.close() needed)
+fig, ax = chart_subplots(figsize=(8, 5))
+phases = ['Discovery', 'Design', 'Implementation', 'Testing']
+ax.bar(phases, [2, 4, 8, 3], color='#4c72b0')
+ax.grid(axis='y', alpha=0.3)
+ax.set_axisbelow(True)
+ax.set_title('Project Timeline')
+fig.tight_layout()
 chart_path = output_dir / 'timeline_chart.png'
-plt.savefig(chart_path, dpi=150, bbox_inches='tight')
-plt.close()
-
-doc.add_picture(str(chart_path), width=Inches(5.5))
+doc.add_picture(save_chart(fig, chart_path), width=FIGURE_WIDTH)
 doc.add_paragraph('Figure 1: Project Timeline')
 ```
 
@@ -142,7 +149,7 @@ flowchart TD
 
 # Use the render_mermaid helper (handles path issues automatically)
 diagram_path = render_mermaid(mermaid_code, 'workflow_diagram')
-doc.add_picture(str(diagram_path), width=Inches(5))
+doc.add_picture(str(diagram_path), width=FIGURE_WIDTH)
 doc.add_paragraph('Figure 2: Project Workflow')
 ```
 
@@ -153,21 +160,18 @@ MERMAID SYNTAX: Do NOT use parentheses () in node text - they break the parser.
 # Title
 doc.add_heading('Proposal Title', level=0)
 
-# Section heading
-doc.add_heading('Executive Summary', level=1)
-doc.add_paragraph('Content here...')
+# Section heading with its opening paragraphs (one batched insert)
+add_section(doc, 'Executive Summary', level=1, paragraphs=['Content here...'])
 
-# Bullet list
-doc.add_paragraph('First point', style='List Bullet')
-doc.add_paragraph('Second point', style='List Bullet')
+# Bullet list (resolve the style once, add all items in one batch)
+bullet_style = doc.styles['List Bullet']
+add_paragraphs(doc, ['First point', 'Second point'], style=bullet_style)
 
-# Table
-table = doc.add_table(rows=3, cols=3)
-table.style = 'Table Grid'
-# ... populate cells
+# Table (bold header row and data rows in one call)
+add_data_table(doc, ('Item', 'Value', 'Reference'), [('Row 1', 'Value', 'Ref'), ('Row 2', 'Value', 'Ref')])
 
-# Page break
-doc.add_page_break()
+# Next section on a new page
+add_section(doc, 'Technical Approach', level=1, page_break=True)
 ```
 
 Write complete, professional code. Do NOT call doc.save() - that's handled externally."""
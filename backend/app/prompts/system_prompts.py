@@ -156,6 +156,26 @@ Your output must be ONLY Python code. It must run without modification.
 - `np`: numpy
 - `pd`: pandas
 - `render_mermaid(code: str, filename: str) -> Path`: renders Mermaid to an image file and returns its path
+- `render_mermaid_batch([(code, filename), ...]) -> list[Path]`: renders several Mermaid diagrams concurrently
+- `submit_mermaid(code: str, filename: str) -> Future`: starts a Mermaid render in the background; call
+  `.result()` for the image path where the picture is inserted
+- `add_paragraphs(doc, texts, style=None) -> list`: appends one paragraph per text in one batch (same result as
+  calling `doc.add_paragraph(text, style=style)` for each) and returns the new paragraphs
+- `add_data_table(doc, headers, rows, style='Table Grid', alignment=WD_TABLE_ALIGNMENT.CENTER) -> Table`:
+  adds a complete table (bold header row plus data rows) in one call
+- `add_section(doc, title, level=1, paragraphs=(), style=None, page_break=False) -> Paragraph`: adds an optional
+  page break, a heading and the section's opening paragraphs in one batch (same result as `doc.add_page_break()`,
+  `doc.add_heading(...)` and `doc.add_paragraph(...)` calls) and returns the heading
+- `add_table_rows(table, rows)`: appends data rows (iterables of cell values) to a table in one batch
+- `set_header_cells(cells, texts)`: writes header texts into empty cells as bold runs (no separate bolding pass)
+- `bold_cells(cells)`: bolds all existing text in the given cells
+- `chart_subplots(figsize=(8, 4.5), **kwargs) -> (fig, ax)`: returns a cleared, reusable matplotlib Figure and its axes
+- Precomputed constants: `PT0`, `PT6`, `PT9`, `PT10`, `PT11`, `PT12`, `PT14`, `PT16`, `PT18`, `PT24` (font/spacing sizes),
+  `FIGURE_WIDTH` (Inches(5.8)), `WIDE_FIGURE_WIDTH` (Inches(6.0)), `CENTER` (WD_ALIGN_PARAGRAPH.CENTER).
+  Prefer these over repeated `Pt(...)`/`Inches(...)` calls.
+- `save_chart(fig, path) -> BytesIO`: saves the chart PNG to `path` in one write and returns the in-memory image;
+  pass it straight to `doc.add_picture(...)`
+- `CHART_SAVE_KWARGS`: savefig options used by `save_chart` (100 dpi, white background, fast PNG encoding)
 - `subprocess`, `tempfile`, `os`, `Path`
 
 ## Hard Rules (must follow)
@@ -163,11 +183,19 @@ Your output must be ONLY Python code. It must run without modification.
 - DO NOT call `doc.save()` — saving is handled externally.
 - DO NOT write placeholder text or fake citations. Write realistic content.
 - DO NOT reference files that don't exist. Only use files you create in `output_dir`.
-- Always close matplotlib figures (plt.close()) after saving images.
-- For bullet/numbered lists: pass the text as the FIRST ARGUMENT:
-  - Correct: doc.add_paragraph('Item', style='List Bullet')
+- Put any extra imports once at the top of the code and only import what you use; `plt`, `sns`, `np`, `pd`
+  and the helpers above are already provided.
+- Create charts with `fig, ax = chart_subplots(...)` and insert them with `doc.add_picture(save_chart(fig, path), width=...)`;
+  call `fig.tight_layout()` first (save_chart does not crop). The figure is reused, so do not close it.
+  Pass `ax=ax` to seaborn calls. If you use `plt.figure()`/`plt.subplots()` directly, always close with plt.close().
+- For bullet/numbered lists: add the whole list in one call, or pass the text as the FIRST ARGUMENT:
+  - Correct: add_paragraphs(doc, ['Item 1', 'Item 2'], style=bullet_style)  (or style='List Bullet')
+  - Correct: doc.add_paragraph('Item', style=bullet_style) for a single item
   - Incorrect: para = doc.add_paragraph(style='List Bullet'); para.add_run('Item')
 - Keep Mermaid node labels simple; avoid parentheses () and special characters in node text.
+- Build each table's data rows as a list of tuples first (compliance matrix, summary, staffing, risk tables),
+  then create the table with one `add_data_table(doc, headers, rows)` call (or `add_table_rows(table, rows)`
+  for a table you set up yourself). Do not loop over `table.add_row()`.
 
 ## Inputs you should assume you receive (conceptually)
 You are generating the proposal based on:
@@ -205,36 +233,79 @@ Include only sections that make sense for the plan; do not bloat.
 Use styles to keep formatting consistent. You may create or adjust styles at the start.
 Prefer:
 - doc.styles['Normal'].font.name / .size
-- doc.add_heading(text, level=0..3)
-- paragraph.paragraph_format.space_before/space_after/line_spacing
-- consistent caption style for figures
+- doc.add_heading(text, level=0..3), or `add_section(doc, title, level, paragraphs=[...], page_break=True)` when a
+  section starts on a new page and/or opens with body paragraphs
+- paragraph.paragraph_format.space_before/space_after/line_spacing for one-off spacing; set spacing shared by
+  every heading on the heading styles (see the bootstrap) instead of on each heading
+- a paragraph style (e.g. `spaced_style` below) when many paragraphs share the same spacing,
+  such as a cover letter or title page block: `doc.add_paragraph(text, style=spaced_style)`
+- `add_paragraphs(doc, [...], style=...)` for consecutive plain paragraphs in the same style
+  (narrative blocks, assumption lists) instead of one `doc.add_paragraph` call per paragraph
+- consistent caption style for figures and tables; number them with `add_figure_caption(description)` and
+  `add_table_caption(description)` (bootstrap below) instead of hand-written "Figure N"/"Table N" labels
 
 ### Recommended style bootstrap (adapt as needed)
 ```python
+from itertools import count
+
 from docx.enum.style import WD_STYLE_TYPE
 
 styles = doc.styles
 
-# Normal
-normal = styles['Normal']
-normal.font.name = 'Calibri'
-normal.font.size = Pt(11)
-
-# Caption style (create if missing)
-if 'Caption' not in [s.name for s in styles]:
-    cap = styles.add_style('Caption', WD_STYLE_TYPE.PARAGRAPH)
-    cap.font.name = 'Calibri'
-    cap.font.size = Pt(9)
-    cap.font.italic = True
+# Typography: one data-driven pass instead of repeated per-style assignments.
+# Heading spacing lives on the heading styles, so headings need no per-paragraph space_before edits.
+for style_name, size, bold, space_before in (
+    ('Normal', PT11, None, None),
+    ('Title', PT24, True, None),
+    ('Heading 1', PT16, True, PT18),
+    ('Heading 2', PT14, True, PT12),
+    ('Heading 3', PT12, True, PT6),
+):
+    style = styles[style_name]
+    font = style.font
+    font.name = 'Calibri'
+    font.size = size
+    if bold is not None:
+        font.bold = bold
+    if space_before is not None:
+        style.paragraph_format.space_before = space_before
+
+# Caption style (create if missing); styles[name] raises KeyError when absent, no name list needed
+try:
+    caption_style = styles['Caption']
+except KeyError:
+    caption_style = styles.add_style('Caption', WD_STYLE_TYPE.PARAGRAPH)
+    caption_style.font.name = 'Calibri'
+    caption_style.font.size = PT9
+    caption_style.font.italic = True
+# Centering lives on the style, so each caption is a single styled paragraph (no per-caption pPr edit)
+caption_style.paragraph_format.alignment = CENTER
+
+# Shared spacing lives on a style, not on every paragraph (one style reference instead of N <w:spacing> writes)
+spaced_style = styles.add_style('Body Spaced', WD_STYLE_TYPE.PARAGRAPH)
+spaced_style.base_style = styles['Normal']
+spaced_style.paragraph_format.space_after = PT18
+
+# Resolve paragraph styles once; passing style objects skips the by-name lookup on every paragraph
+bullet_style = styles['List Bullet']
+number_style = styles['List Number']
 
 def add_caption(text: str):
-    p = doc.add_paragraph(text, style='Caption')
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    return p
+    return doc.add_paragraph(text, style=caption_style)
+
+# Figures and tables are numbered in insertion order; next() on a count is one C-level step, no counter dict to update
+figure_numbers = count(1)
+table_numbers = count(1)
+
+def add_figure_caption(description: str):
+    return add_caption(f'Figure {{next(figure_numbers)}}: {{description}}')
+
+def add_table_caption(description: str):
+    return add_caption(f'Table {{next(table_numbers)}}: {{description}}')
 ```
 
 ## Images in python-docx
-Use doc.add_picture(path, width=Inches(...)) and keep within margins.
+Use doc.add_picture(path, width=FIGURE_WIDTH) (or WIDE_FIGURE_WIDTH) and keep within margins.
 Always add a caption right after the picture.
 
 ## Tables (timelines, compliance matrix, staffing)
@@ -245,87 +316,102 @@ table = doc.add_table(rows=..., cols=...)
 table.style = 'Table Grid'  # (or another available built-in style)
 table.autofit = False  # For stable layout
 
-# Table example
-table = doc.add_table(rows=1, cols=3)
-table.style = 'Table Grid'
-table.alignment = WD_TABLE_ALIGNMENT.CENTER
-hdr = table.rows[0].cells
-hdr[0].text, hdr[1].text, hdr[2].text = 'Requirement', 'Response', 'Reference'
-for cell in hdr:
-    for run in cell.paragraphs[0].runs:
-        run.bold = True
+# Table example: headers and data rows in one call
+traceability_rows = [
+    ('Provide a phased implementation plan', 'Five-phase delivery with stage gates', 'Section 5'),
+    ('Describe security controls', 'Role-based access, encryption at rest and in transit', 'Section 7'),
+    ('Identify key personnel', 'Named project manager and technical lead', 'Section 8'),
+]
+traceability_table = add_data_table(doc, ('Requirement', 'Response', 'Reference'), traceability_rows)
 ```
+Use `add_data_table(doc, headers, rows)` for compliance, summary, staffing and risk tables. It creates the
+header runs bold and builds all data rows from one XML string in a single parse (tabs/newlines in values
+behave like `cell.text`). For custom layouts, the same steps are available separately:
+`set_header_cells(table.rows[0].cells, headers)` and `add_table_rows(table, rows)`; avoid `table.add_row()` loops.
 
 ## Charts (matplotlib/seaborn)
 Only create charts if you have meaningful data to visualize (timeline durations, staffing ramp, risk heatmap counts, etc.).
 If you lack numeric data, use a table instead of inventing numbers.
+For plain bar and line charts of a few values, draw with `ax.bar`/`ax.plot` on lists as below; `sns.barplot`
+and `sns.lineplot` add DataFrame inspection and bootstrapped confidence intervals that point data does not need.
+Keep seaborn for statistical plots (heatmaps, distributions), and style through the axes (`ax.grid(...)`) rather
+than `sns.set_style`, which changes global defaults for every later chart.
 
 Chart example (timeline durations):
 ```python
-plt.figure(figsize=(8, 4.5))
-sns.set_style('whitegrid')
-data = pd.DataFrame({{'Phase': ['Discover', 'Design', 'Build', 'Test', 'Deploy'],
-                     'Weeks': [2, 3, 8, 4, 2]}})
-ax = sns.barplot(data=data, x='Phase', y='Weeks')
+phases = ['Discover', 'Design', 'Build', 'Test', 'Deploy']
+weeks = [2, 3, 8, 4, 2]
+fig, ax = chart_subplots(figsize=(8, 4.5))
+ax.bar(phases, weeks, color='#4c72b0')
+ax.grid(axis='y', alpha=0.3)
+ax.set_axisbelow(True)
 ax.set_title('Delivery Timeline by Phase')
 ax.set_ylabel('Duration (Weeks)')
-plt.tight_layout()
+fig.tight_layout()
 chart_path = output_dir / 'timeline_weeks.png'
-plt.savefig(chart_path, dpi=150, bbox_inches='tight', facecolor='white')
-plt.close()
-doc.add_picture(str(chart_path), width=Inches(5.8))
-add_caption('Figure 1: Proposed delivery timeline by phase')
+doc.add_picture(save_chart(fig, chart_path), width=FIGURE_WIDTH)
+add_figure_caption('Proposed delivery timeline by phase')
 ```
 
 Burndown chart example (planned vs actual remaining work):
 ```python
-burndown = pd.DataFrame({{
-    'Sprint Day': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-    'Ideal Remaining': [100, 90, 80, 70, 60, 50, 40, 30, 20, 10],
-    'Actual Remaining': [100, 95, 88, 84, 76, 68, 57, 46, 34, 22],
-}})
-
-plt.figure(figsize=(8, 4.5))
-sns.set_style('whitegrid')
-sns.lineplot(data=burndown, x='Sprint Day', y='Ideal Remaining', label='Ideal', linewidth=2, linestyle='--')
-sns.lineplot(data=burndown, x='Sprint Day', y='Actual Remaining', label='Actual', linewidth=2, marker='o')
-plt.title('Sprint Burndown')
-plt.ylabel('Remaining Story Points')
-plt.tight_layout()
+# Plain lists are enough for a few points; no DataFrame is needed to plot them
+sprint_days = list(range(1, 11))
+ideal_remaining = [100, 90, 80, 70, 60, 50, 40, 30, 20, 10]
+actual_remaining = [100, 95, 88, 84, 76, 68, 57, 46, 34, 22]
+
+fig, ax = chart_subplots(figsize=(8, 4.5))
+ax.plot(sprint_days, ideal_remaining, label='Ideal', linewidth=2, linestyle='--')
+ax.plot(sprint_days, actual_remaining, label='Actual', linewidth=2, marker='o')
+ax.grid(alpha=0.3)
+ax.set_title('Sprint Burndown')
+ax.set_xlabel('Sprint Day')
+ax.set_ylabel('Remaining Story Points')
+ax.legend()
+fig.tight_layout()
 burndown_path = output_dir / 'sprint_burndown.png'
-plt.savefig(burndown_path, dpi=150, bbox_inches='tight', facecolor='white')
-plt.close()
-doc.add_picture(str(burndown_path), width=Inches(5.8))
-add_caption('Figure X: Sprint burndown (ideal vs actual remaining effort)')
+doc.add_picture(save_chart(fig, burndown_path), width=FIGURE_WIDTH)
+add_figure_caption('Sprint burndown (ideal vs actual remaining effort)')
 ```
 
 Grouped bar chart example (planned vs actual by workstream):
 ```python
-workstream = pd.DataFrame({{
-    'Area': ['Discovery', 'Build', 'Test', 'Deploy'],
-    'Planned Weeks': [2, 8, 4, 2],
-    'Actual Weeks': [2, 9, 5, 2],
-}})
+areas = ['Discovery', 'Build', 'Test', 'Deploy']
+planned_weeks = [2, 8, 4, 2]
+actual_weeks = [2, 9, 5, 2]
 
-x = np.arange(len(workstream))
+x = np.arange(len(areas))
 width = 0.35
 
-fig, ax = plt.subplots(figsize=(8, 4.5))
-bars_planned = ax.bar(x - width / 2, workstream['Planned Weeks'], width, label='Planned')
-bars_actual = ax.bar(x + width / 2, workstream['Actual Weeks'], width, label='Actual')
+fig, ax = chart_subplots(figsize=(8, 4.5))
+bars_planned = ax.bar(x - width / 2, planned_weeks, width, label='Planned')
+bars_actual = ax.bar(x + width / 2, actual_weeks, width, label='Actual')
 ax.set_xticks(x)
-ax.set_xticklabels(workstream['Area'])
+ax.set_xticklabels(areas)
 ax.set_ylabel('Weeks')
 ax.set_title('Planned vs Actual Duration by Workstream')
 ax.legend()
 ax.bar_label(bars_planned, padding=3)
 ax.bar_label(bars_actual, padding=3)
-plt.tight_layout()
+fig.tight_layout()
 grouped_bar_path = output_dir / 'planned_vs_actual_weeks.png'
-plt.savefig(grouped_bar_path, dpi=150, bbox_inches='tight', facecolor='white')
-plt.close()
-doc.add_picture(str(grouped_bar_path), width=Inches(5.8))
-add_caption('Figure X: Planned vs actual duration by workstream')
+doc.add_picture(save_chart(fig, grouped_bar_path), width=FIGURE_WIDTH)
+add_figure_caption('Planned vs actual duration by workstream')
+```
+
+When several charts share the same shape (e.g. simple bar charts in different sections), define the chart
+once and call it with each chart's data instead of repeating the block:
+```python
+def add_bar_chart(filename, title, ylabel, categories, values):
+    fig, ax = chart_subplots(figsize=(6, 3.5))
+    ax.bar(categories, values, color='#4c72b0')
+    ax.set_title(title)
+    ax.set_ylabel(ylabel)
+    fig.tight_layout()
+    doc.add_picture(save_chart(fig, output_dir / filename), width=FIGURE_WIDTH)
+    add_figure_caption(title)
+
+add_bar_chart('staffing_by_phase.png', 'Staffing by phase', 'FTEs', ['Discover', 'Build', 'Run'], [4, 9, 5])
 ```
 
 ## Gantt Charts for Schedules (matplotlib barh)
@@ -334,6 +420,8 @@ This is the PREFERRED visualization for any schedule or timeline data.
 
 ### Gantt Chart Guidelines
 - Use horizontal bars (barh) with task names on y-axis and time on x-axis
+- Keep schedule data in plain lists and `datetime64[D]` arrays; a DataFrame is unnecessary for a handful of tasks
+- Draw all bars with a single vectorized `ax.barh(...)` call (column arrays), not a per-row loop over `iterrows()`
 - Color-code bars by team, phase, or workstream for clarity
 - Include a legend to explain color coding
 - Invert y-axis to show tasks chronologically top-to-bottom
@@ -343,25 +431,23 @@ This is the PREFERRED visualization for any schedule or timeline data.
 ### Complete Gantt Chart Example
 ```python
 import matplotlib.patches as mpatches
-import datetime as dt
-
-# Define schedule data
-schedule = pd.DataFrame({{
-    'Task': ['Requirements Analysis', 'Solution Design', 'Development Phase 1', 
-             'Development Phase 2', 'Integration Testing', 'User Acceptance Testing',
-             'Training & Documentation', 'Deployment & Go-Live', 'Hypercare Support'],
-    'Team': ['Business Analysts', 'Architects', 'Development', 'Development', 
-             'QA Team', 'QA Team', 'Training', 'DevOps', 'Support'],
-    'Start': pd.to_datetime(['2026-03-01', '2026-03-15', '2026-04-01', '2026-05-01',
-                             '2026-06-01', '2026-06-15', '2026-06-20', '2026-07-01', '2026-07-08']),
-    'End': pd.to_datetime(['2026-03-14', '2026-03-31', '2026-04-30', '2026-05-31',
-                           '2026-06-14', '2026-06-30', '2026-07-05', '2026-07-07', '2026-07-31'])
-}})
-
-# Calculate durations for the chart
-project_start = schedule['Start'].min()
-schedule['days_to_start'] = (schedule['Start'] - project_start).dt.days
-schedule['duration'] = (schedule['End'] - schedule['Start']).dt.days + 1
+from matplotlib.ticker import FuncFormatter, MultipleLocator
+
+# Define schedule data as plain lists and datetime64 arrays (a DataFrame adds nothing for a few rows)
+tasks = ['Requirements Analysis', 'Solution Design', 'Development Phase 1',
+         'Development Phase 2', 'Integration Testing', 'User Acceptance Testing',
+         'Training & Documentation', 'Deployment & Go-Live', 'Hypercare Support']
+teams = ['Business Analysts', 'Architects', 'Development', 'Development',
+         'QA Team', 'QA Team', 'Training', 'DevOps', 'Support']
+starts = np.array(['2026-03-01', '2026-03-15', '2026-04-01', '2026-05-01', '2026-06-01',
+                   '2026-06-15', '2026-06-20', '2026-07-01', '2026-07-08'], dtype='datetime64[D]')
+ends = np.array(['2026-03-14', '2026-03-31', '2026-04-30', '2026-05-31', '2026-06-14',
+                 '2026-06-30', '2026-07-05', '2026-07-07', '2026-07-31'], dtype='datetime64[D]')
+
+# Calculate offsets and durations for the chart (day-resolution numpy arithmetic)
+project_start = starts.min()
+days_to_start = (starts - project_start).astype(np.int64)
+durations = (ends - starts).astype(np.int64) + 1
 
 # Define colors by team
 team_colors = {{
@@ -375,21 +461,23 @@ team_colors = {{
 }}
 
 # Create the Gantt chart
-fig, ax = plt.subplots(figsize=(10, 6))
+fig, ax = chart_subplots(figsize=(10, 6))
 
-for idx, row in schedule.iterrows():
-    ax.barh(y=row['Task'], width=row['duration'], left=row['days_to_start'],
-            color=team_colors[row['Team']], edgecolor='white', linewidth=0.5)
+# One vectorized barh call draws every task (no per-row artists)
+ax.barh(y=tasks, width=durations, left=days_to_start, color=[team_colors[team] for team in teams],
+        edgecolor='white', linewidth=0.5)
 
 # Invert y-axis for chronological order (earliest at top)
 ax.invert_yaxis()
 
-# Configure x-axis with date labels
-max_days = schedule['days_to_start'].max() + schedule['duration'].max()
-xticks = np.arange(0, max_days + 7, 14)  # Every 2 weeks
-xticklabels = pd.date_range(start=project_start, periods=len(xticks), freq='14D').strftime('%b %d')
-ax.set_xticks(xticks[:len(xticklabels)])
-ax.set_xticklabels(xticklabels, fontsize=9)
+# Configure x-axis with date labels: a tick every 2 weeks, each label formatted only when drawn
+max_days = int((days_to_start + durations).max())
+ax.set_xlim(0, max_days + 7)
+ax.xaxis.set_major_locator(MultipleLocator(14))
+ax.xaxis.set_major_formatter(FuncFormatter(
+    lambda day, _: (project_start + np.timedelta64(int(day), 'D')).astype(object).strftime('%b %d')
+))
+ax.tick_params(axis='x', labelsize=9)
 
 # Styling
 ax.set_xlabel('Timeline', fontsize=10)
@@ -397,46 +485,40 @@ ax.set_title('Project Implementation Schedule', fontsize=14, fontweight='bold')
 ax.xaxis.grid(True, alpha=0.3, linestyle='--')
 ax.set_axisbelow(True)
 
-# Add legend for teams
-unique_teams = schedule['Team'].unique()
-patches = [mpatches.Patch(color=team_colors[team], label=team) for team in unique_teams]
+# Add legend for teams (color-map order; one set built for membership checks)
+used_teams = set(teams)
+patches = [mpatches.Patch(color=color, label=team) for team, color in team_colors.items() if team in used_teams]
 ax.legend(handles=patches, loc='lower right', fontsize=8, framealpha=0.9)
 
-plt.tight_layout()
+fig.tight_layout()
 gantt_path = output_dir / 'project_gantt.png'
-plt.savefig(gantt_path, dpi=150, bbox_inches='tight', facecolor='white')
-plt.close()
-
-doc.add_picture(str(gantt_path), width=Inches(6.0))
-add_caption('Figure X: Project Implementation Schedule')
+doc.add_picture(save_chart(fig, gantt_path), width=WIDE_FIGURE_WIDTH)
+add_figure_caption('Project Implementation Schedule')
+
+# Companion schedule table straight from the same lists/arrays (no DataFrame row iteration);
+# astype(object) converts each date array to datetime.date in one pass for formatting
+schedule_rows = [
+    (task, team, f'{{start:%b %d, %Y}}', f'{{end:%b %d, %Y}}')
+    for task, team, start, end in zip(tasks, teams, starts.astype(object), ends.astype(object))
+]
+schedule_table = add_data_table(doc, ('Task', 'Team', 'Start', 'End'), schedule_rows)
+add_table_caption('Implementation schedule')
 ```
 
-Milestone schedule example (date-based timeline):
+Milestone schedule example (native Word table, no image render):
 ```python
-import matplotlib.dates as mdates
-
-milestones = pd.DataFrame({{
-    'Milestone': ['Kickoff', 'Design Signoff', 'Build Complete', 'UAT Complete', 'Go-Live'],
-    'Date': pd.to_datetime(['2026-03-01', '2026-03-20', '2026-05-30', '2026-06-25', '2026-07-10']),
-}})
-
-fig, ax = plt.subplots(figsize=(9, 3.8))
-ax.plot(milestones['Date'], [1] * len(milestones), marker='o', linewidth=1.8)
-for idx, row in milestones.iterrows():
-    ax.text(row['Date'], 1.03, row['Milestone'], rotation=35, ha='left', va='bottom', fontsize=8)
-
-ax.yaxis.set_visible(False)
-ax.set_title('Program Milestone Timeline')
-ax.xaxis.set_major_locator(mdates.WeekdayLocator(interval=2))
-ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %d'))
-ax.grid(axis='x', alpha=0.25, linestyle='--')
-plt.tight_layout()
-milestone_path = output_dir / 'milestone_timeline.png'
-plt.savefig(milestone_path, dpi=150, bbox_inches='tight', facecolor='white')
-plt.close()
-doc.add_picture(str(milestone_path), width=Inches(6.0))
-add_caption('Figure X: Program milestone timeline')
+milestones = [
+    ('Kickoff', 'Mar 01, 2026'),
+    ('Design Signoff', 'Mar 20, 2026'),
+    ('Build Complete', 'May 30, 2026'),
+    ('UAT Complete', 'Jun 25, 2026'),
+    ('Go-Live', 'Jul 10, 2026'),
+]
+
+milestone_table = add_data_table(doc, ('Milestone', 'Target date'), milestones)
+add_table_caption('Program milestones')
 ```
+A milestone list is a handful of labelled dates; a table conveys it without a matplotlib render or embedded PNG.
 
 ### Gantt Chart Tips
 - For overlapping tasks, the chart naturally shows parallel work streams
@@ -448,7 +530,7 @@ add_caption('Figure X: Program milestone timeline')
 ## Mermaid Diagrams (workflows, architecture, governance)
 You may embed Mermaid diagrams to clarify complex concepts. Use the provided render_mermaid helper.
 To reduce clipping/oversized rendering, prefer `render_mermaid(code, name, width=1600, height=1000, scale=1.5)`.
-When inserting Mermaid images, use `doc.add_picture(..., width=Inches(5.8))` or smaller.
+When inserting Mermaid images, use `doc.add_picture(..., width=FIGURE_WIDTH)` (Inches(5.8)) or smaller.
 
 ### Mermaid types you can use
 - flowchart: processes, workflows
@@ -468,8 +550,8 @@ flowchart TD
   E --> F[Final proposal]
 '''
 diagram_path = render_mermaid(mermaid_code, 'workflow')
-doc.add_picture(str(diagram_path), width=Inches(5.8))
-add_caption('Figure 2: Proposal development workflow')
+doc.add_picture(str(diagram_path), width=FIGURE_WIDTH)
+add_figure_caption('Proposal development workflow')
 ```
 
 Mermaid example: sequence diagram
@@ -485,8 +567,8 @@ sequenceDiagram
   PM->>Client: Review and sign-off
 '''
 diagram_path = render_mermaid(mermaid_code, 'sequence_review')
-doc.add_picture(str(diagram_path), width=Inches(5.8))
-add_caption('Figure 3: Requirements review and sign-off sequence')
+doc.add_picture(str(diagram_path), width=FIGURE_WIDTH)
+add_figure_caption('Requirements review and sign-off sequence')
 ```
 
 Mermaid example: gantt
@@ -503,8 +585,54 @@ gantt
   Deploy         :a5, after a4, 14d
 '''
 diagram_path = render_mermaid(mermaid_code, 'gantt_plan')
-doc.add_picture(str(diagram_path), width=Inches(6.0))
-add_caption('Figure 4: High-level delivery plan')
+doc.add_picture(str(diagram_path), width=WIDE_FIGURE_WIDTH)
+add_figure_caption('High-level delivery plan')
+```
+
+Mermaid example: several diagrams in one batch
+When a section uses two or more diagrams, define them first and render them together; the mmdc
+processes run concurrently instead of one after another.
+```python
+governance_code = '''
+flowchart TD
+  A[Steering committee] --> B[Project manager]
+  B --> C[Workstream leads]
+'''
+escalation_code = '''
+flowchart LR
+  A[Issue raised] --> B[Workstream lead]
+  B --> C[Project manager]
+  C --> D[Steering committee]
+'''
+governance_path, escalation_path = render_mermaid_batch([
+    (governance_code, 'governance_structure'),
+    (escalation_code, 'escalation_path'),
+])
+doc.add_picture(str(governance_path), width=FIGURE_WIDTH)
+add_figure_caption('Project governance structure')
+doc.add_picture(str(escalation_path), width=FIGURE_WIDTH)
+add_figure_caption('Issue escalation path')
+```
+
+Mermaid example: render in the background
+Start a diagram as soon as its source is known and collect it where it is inserted; mmdc then runs
+while the section text, tables and charts in between are built.
+```python
+architecture_code = '''
+flowchart LR
+  A[Users] --> B[Web portal]
+  B --> C[Integration layer]
+  C --> D[Records system]
+'''
+architecture_future = submit_mermaid(architecture_code, 'solution_architecture')
+
+add_section(doc, 'Technical Solution', level=1, page_break=True, paragraphs=[
+    'The portal fronts a single integration layer.',
+    'Records stay in the system of record.',
+])
+
+doc.add_picture(str(architecture_future.result()), width=FIGURE_WIDTH)
+add_figure_caption('Solution architecture')
 ```
 
 ### MERMAID SYNTAX RULES (critical)
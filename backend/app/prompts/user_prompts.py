@@ -194,7 +194,7 @@ GENERATE_WITH_ERROR_USER_PROMPT = """The previous document code failed to execut
 Fix the error in the code and regenerate. Common issues:
 - Mermaid syntax: Do NOT use parentheses () in node labels, use [square brackets]
 - Bullet lists: Pass text as first arg: doc.add_paragraph('text', style='List Bullet')
-- Charts: Always close figures with plt.close() after saving
+- Charts: Use chart_subplots() and save_chart(fig, path); close any plt.figure()/plt.subplots() figures with plt.close()
 - Paths: Use output_dir / 'filename.png' for image paths
 
 Use the generate_rfp_response function to return your corrected document_code.
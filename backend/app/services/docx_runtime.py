@@ -0,0 +1,380 @@
+"""
+Document Runtime - Helpers exposed to generated python-docx document code.
+"""
+
+import hashlib
+import io
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from types import MappingProxyType
+from typing import Iterable, Optional
+from weakref import WeakKeyDictionary
+from xml.sax.saxutils import escape
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Inches, Pt
+from docx.styles.style import BaseStyle
+from docx.text.paragraph import Paragraph
+
+
+# Measurements and alignments reused throughout generated documents.
+# Built once at import instead of on every Pt()/Inches() call in the code.
+PT0, PT6, PT9, PT10, PT11, PT12, PT14, PT16, PT18, PT24 = map(Pt, (0, 6, 9, 10, 11, 12, 14, 16, 18, 24))
+FIGURE_WIDTH = Inches(5.8)
+WIDE_FIGURE_WIDTH = Inches(6.0)
+CENTER = WD_ALIGN_PARAGRAPH.CENTER
+
+# Charts are embedded at roughly 6in wide; 100 dpi still covers Word's 96 dpi
+# screen rendering while keeping PNGs (and the zipped .docx) small. Charts lay
+# themselves out with fig.tight_layout(), so bbox_inches="tight" (an extra full
+# draw per save just to measure the crop) is left off.
+CHART_DPI = 100
+CHART_SAVE_KWARGS = MappingProxyType({
+    "dpi": CHART_DPI,
+    "facecolor": "white",
+    # PIL's optimize=True forces zlib level 9 and roughly doubles encode time;
+    # level 1 is the fastest encode for a modestly larger PNG (~25 KB vs ~16 KB).
+    "pil_kwargs": {"compress_level": 1},
+})
+
+RUNTIME_CONSTANTS = {
+    "PT0": PT0,
+    "PT6": PT6,
+    "PT9": PT9,
+    "PT10": PT10,
+    "PT11": PT11,
+    "PT12": PT12,
+    "PT14": PT14,
+    "PT16": PT16,
+    "PT18": PT18,
+    "PT24": PT24,
+    "FIGURE_WIDTH": FIGURE_WIDTH,
+    "WIDE_FIGURE_WIDTH": WIDE_FIGURE_WIDTH,
+    "CENTER": CENTER,
+    "CHART_DPI": CHART_DPI,
+    "CHART_SAVE_KWARGS": CHART_SAVE_KWARGS,
+}
+
+_RUN_BREAK_PATTERN = re.compile(r"([\t\r\n])")
+_PAGE_BREAK_XML = '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+
+# python-docx resolves a style on every use and scans all styles for the type's default
+# each time (a few ms on the stock template). Style ids do not change once a style exists,
+# so each document part keeps the ids it has already resolved.
+_STYLE_IDS: "WeakKeyDictionary[object, dict]" = WeakKeyDictionary()
+
+
+def _style_id(doc, style, style_type: WD_STYLE_TYPE) -> Optional[str]:
+    """Return ``doc.part.get_style_id(style, style_type)``, resolved once per document."""
+    style_ids = _STYLE_IDS.setdefault(doc.part, {})
+    key = (style.style_id if isinstance(style, BaseStyle) else style, style_type)
+    if key not in style_ids:
+        style_ids[key] = doc.part.get_style_id(style, style_type)
+    return style_ids[key]
+
+
+def _run_xml(text: str, run_properties: str = "") -> str:
+    """Return ``<w:r>`` markup for ``text``, mapping tabs/line breaks like ``Run.text``.
+
+    As in python-docx, every ``\\t`` becomes ``<w:tab/>`` and every ``\\r`` or ``\\n``
+    becomes its own ``<w:br/>`` (so ``"\\r\\n"`` gives two breaks).
+    """
+    pieces = []
+    for token in _RUN_BREAK_PATTERN.split(text):
+        if not token:
+            continue
+        if token == "\t":
+            pieces.append("<w:tab/>")
+        elif token in ("\r", "\n"):
+            pieces.append("<w:br/>")
+        elif token != token.strip():
+            pieces.append(f'<w:t xml:space="preserve">{escape(token)}</w:t>')
+        else:
+            pieces.append(f"<w:t>{escape(token)}</w:t>")
+    return f"<w:r>{run_properties}{''.join(pieces)}</w:r>" if pieces else ""
+
+
+def add_table_rows(table, rows: Iterable[Iterable[object]]) -> None:
+    """Append ``rows`` to ``table`` from one joined XML string and a single parse.
+
+    Produces the same cells as ``table.add_row()`` followed by ``cell.text = ...``
+    (one paragraph and run per cell, widths taken from the table grid) without
+    the per-row and per-cell python-docx proxy work. Short rows are padded with
+    empty cells; extra values are ignored.
+    """
+    tbl = table._tbl
+    tc_props = [
+        f'<w:tcPr><w:tcW w:type="dxa" w:w="{grid_col.w.twips}"/></w:tcPr>' if grid_col.w is not None else ""
+        for grid_col in tbl.tblGrid.gridCol_lst
+    ]
+    column_count = len(tc_props)
+    row_xml = []
+    for row in rows:
+        values = [str(value) for value in row][:column_count]
+        values.extend([""] * (column_count - len(values)))
+        cells = "".join(
+            f"<w:tc>{tc_pr}<w:p>{_run_xml(value)}</w:p></w:tc>" for tc_pr, value in zip(tc_props, values)
+        )
+        row_xml.append(f"<w:tr>{cells}</w:tr>")
+    if row_xml:
+        tbl.extend(parse_xml(f"<w:tbl {nsdecls('w')}>{''.join(row_xml)}</w:tbl>"))
+
+
+def _paragraphs_xml(doc, texts: Iterable[object], style) -> str:
+    """Return ``<w:p>`` markup for ``texts`` in ``style``, resolving the style id once."""
+    style_id = _style_id(doc, style, WD_STYLE_TYPE.PARAGRAPH)
+    p_pr = f'<w:pPr><w:pStyle w:val="{escape(style_id, {chr(34): "&quot;"})}"/></w:pPr>' if style_id else ""
+    return "".join(f"<w:p>{p_pr}{_run_xml(str(text))}</w:p>" for text in texts)
+
+
+def _append_body_xml(doc, paragraph_xml: str) -> list[Paragraph]:
+    """Parse ``paragraph_xml`` once and insert its elements before the body's sectPr."""
+    if not paragraph_xml:
+        return []
+    new_paragraphs = list(parse_xml(f"<w:body {nsdecls('w')}>{paragraph_xml}</w:body>"))
+    body = doc.element.body
+    sect_pr = body.sectPr
+    for p in new_paragraphs:
+        if sect_pr is None:
+            body.append(p)
+        else:
+            sect_pr.addprevious(p)
+    parent = doc._body
+    return [Paragraph(p, parent) for p in new_paragraphs]
+
+
+def add_paragraphs(doc, texts: Iterable[str], style=None) -> list[Paragraph]:
+    """Append one paragraph per entry in ``texts`` from a single XML parse.
+
+    Produces the same markup as calling ``doc.add_paragraph(text, style=style)``
+    for each entry, but resolves the style once and inserts every ``<w:p>`` in
+    one pass instead of going through the python-docx proxies per paragraph.
+    ``style`` may be a style object or name; the default paragraph style is
+    omitted just as ``add_paragraph`` omits it.
+    """
+    return _append_body_xml(doc, _paragraphs_xml(doc, texts, style))
+
+
+def add_section(
+    doc,
+    title: str,
+    level: int = 1,
+    paragraphs: Iterable[str] = (),
+    style=None,
+    page_break: bool = False,
+) -> Paragraph:
+    """Add a section opening (optional page break, heading, first paragraphs) in one parse.
+
+    Equivalent to ``doc.add_page_break()`` when ``page_break`` is set, then
+    ``doc.add_heading(title, level)`` and ``doc.add_paragraph(text, style)`` for
+    each entry in ``paragraphs``. Returns the heading paragraph.
+    """
+    if not 0 <= level <= 9:
+        raise ValueError(f"level must be in range 0-9, got {level}")
+    heading_style = "Title" if level == 0 else f"Heading {level}"
+    section_xml = (
+        (_PAGE_BREAK_XML if page_break else "")
+        + _paragraphs_xml(doc, [title], heading_style)
+        + _paragraphs_xml(doc, paragraphs, style)
+    )
+    return _append_body_xml(doc, section_xml)[1 if page_break else 0]
+
+
+def set_header_cells(cells, texts: Iterable[object]) -> None:
+    """Write ``texts`` into empty ``cells`` as runs that are bold from the start.
+
+    Same markup as ``cell.paragraphs[0].add_run(text).bold = True`` per cell, but
+    every run is parsed in one pass and no Run/Font proxies are created, so a
+    header row needs no separate bolding walk afterwards.
+    """
+    # Empty texts keep their position as a bare <w:r/> and leave that cell empty.
+    runs_xml = "".join(_run_xml(str(text), "<w:rPr><w:b/></w:rPr>") or "<w:r/>" for text in texts)
+    runs = parse_xml(f"<w:p {nsdecls('w')}>{runs_xml}</w:p>")
+    for cell, r in zip(cells, list(runs)):
+        if len(r):
+            cell._tc.p_lst[0].append(r)
+
+
+def add_data_table(
+    doc,
+    headers: Iterable[object],
+    rows: Iterable[Iterable[object]],
+    style="Table Grid",
+    alignment: Optional[WD_TABLE_ALIGNMENT] = WD_TABLE_ALIGNMENT.CENTER,
+):
+    """Add a table with a bold header row and ``rows`` of data, and return it.
+
+    One call covers the usual compliance/summary/staffing table: python-docx
+    creates the table shell, ``set_header_cells`` writes the header and
+    ``add_table_rows`` appends every data row in one parse. The table style is
+    resolved once per document rather than on every table.
+    """
+    headers = list(headers)
+    table = doc.add_table(rows=1, cols=len(headers))
+    if style is not None:
+        table._tbl.tblStyle_val = _style_id(doc, style, WD_STYLE_TYPE.TABLE)
+    if alignment is not None:
+        table.alignment = alignment
+    set_header_cells(table.rows[0].cells, headers)
+    add_table_rows(table, rows)
+    return table
+
+
+def bold_cells(cells) -> None:
+    """Bold every run in ``cells`` by adding ``<w:b/>`` to each run's properties.
+
+    Equivalent to ``run.bold = True`` for each run, without building Run/Font
+    proxies for every run in a header row.
+    """
+    for cell in cells:
+        for r in cell._tc.iter(qn("w:r")):
+            rPr = r.get_or_add_rPr()
+            if rPr.b is None:
+                rPr._add_b()
+            else:
+                rPr.b.val = True
+
+
+def save_chart(fig, path) -> io.BytesIO:
+    """Render ``fig`` to PNG in memory, write it to ``path`` in one call and return the buffer.
+
+    The returned buffer is rewound and can be passed straight to
+    ``doc.add_picture``, so the image is not read back from disk.
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", **CHART_SAVE_KWARGS)
+    Path(path).write_bytes(buffer.getvalue())
+    buffer.seek(0)
+    return buffer
+
+
+# Keyword arguments plt.subplots() hands to Figure.subplots(); everything else configures the figure.
+_SUBPLOT_KWARGS = frozenset(
+    {"nrows", "ncols", "sharex", "sharey", "squeeze", "width_ratios", "height_ratios", "subplot_kw", "gridspec_kw"}
+)
+
+
+class SharedFigure:
+    """Single pyplot figure reused across every chart rendered in the process.
+
+    Creating a pyplot figure per chart pays for figure-manager and canvas setup
+    each time. Charts are saved immediately after drawing, so one figure can be
+    cleared and resized between renders (and between document builds) instead.
+    The figure stays registered with pyplot and is made current on every call,
+    so ``plt.xticks``/``plt.title`` and seaborn calls without ``ax=`` draw on it.
+    After a build the executor closes every other figure and only clears this one.
+    """
+
+    NUM = "rfp-chart"
+
+    def __init__(self):
+        self._plain = False
+
+    def subplots(self, figsize: tuple[float, float] = (8, 4.5), **kwargs):
+        """Return a cleared ``(fig, ax)`` pair sized to ``figsize``, like ``plt.subplots``.
+
+        Subplot-layout keywords (``nrows``, ``sharex``, ...) go to
+        ``Figure.subplots``; figure keywords (``dpi``, ``facecolor``,
+        ``constrained_layout``, ...) recreate the figure with those settings,
+        since pyplot ignores them when reusing an existing figure.
+        """
+        import matplotlib.pyplot as plt
+
+        subplot_kwargs = {key: kwargs.pop(key) for key in _SUBPLOT_KWARGS & kwargs.keys()}
+        if kwargs or not self._plain or not plt.fignum_exists(self.NUM):
+            plt.close(self.NUM)
+            figure = plt.figure(num=self.NUM, figsize=figsize, **kwargs)
+            self._plain = not kwargs
+        else:
+            figure = plt.figure(num=self.NUM, clear=True)
+            figure.set_size_inches(figsize)
+        return figure, figure.subplots(**subplot_kwargs)
+
+    def reset(self) -> None:
+        """Drop the last chart's artists but keep the figure and canvas for reuse."""
+        import matplotlib.pyplot as plt
+
+        if plt.fignum_exists(self.NUM):
+            plt.figure(num=self.NUM).clear()
+
+    def close(self) -> None:
+        """Release the underlying figure."""
+        import matplotlib.pyplot as plt
+
+        plt.close(self.NUM)
+        self._plain = False
+
+
+# Document code runs synchronously inside exec(), so builds never draw on the
+# shared figure concurrently and it can live for the whole process.
+CHART_FIGURE = SharedFigure()
+
+
+class MermaidCache:
+    """Content-addressed disk cache for rendered Mermaid PNGs.
+
+    Rendering shells out to ``mmdc`` (headless Chromium) and dominates the cost
+    of a document build. Identical diagram source and render settings always
+    produce the same image, so the PNG is keyed on a hash of both. At most
+    ``maxsize`` images are kept; the least recently used ones are pruned.
+    """
+
+    def __init__(self, cache_dir: Path, maxsize: int = 64):
+        self.cache_dir = Path(cache_dir)
+        self.maxsize = maxsize
+
+    @staticmethod
+    def key(mermaid_code: str, width: int, height: int, scale: float) -> str:
+        """Hash diagram source together with the settings that affect the output."""
+        payload = f"{width}x{height}@{scale}\n{mermaid_code}".encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def fetch(self, key: str, destination: Path) -> bool:
+        """Copy a cached PNG to ``destination``; return False on a cache miss."""
+        cached = self.cache_dir / f"{key}.png"
+        try:
+            shutil.copyfile(cached, destination)
+            # Refresh the mtime so pruning drops the least recently used images first.
+            os.utime(cached)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def store(self, key: str, source: Path) -> None:
+        """Add a freshly rendered PNG to the cache.
+
+        The image is written to a temporary file and renamed into place, so
+        concurrent renders or an interrupted copy never leave a truncated PNG
+        under the cache key.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix=f".{key}.", suffix=".tmp", dir=self.cache_dir)
+        os.close(fd)
+        try:
+            shutil.copyfile(source, temp_name)
+            os.replace(temp_name, self.cache_dir / f"{key}.png")
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        self._prune()
+
+    def _prune(self) -> None:
+        """Delete the least recently used images beyond ``maxsize``."""
+        entries: list[tuple[float, Path]] = []
+        for cached in self.cache_dir.glob("*.png"):
+            try:
+                entries.append((cached.stat().st_mtime, cached))
+            except FileNotFoundError:
+                continue
+        if len(entries) <= self.maxsize:
+            return
+        entries.sort()
+        for _, cached in entries[: len(entries) - self.maxsize]:
+            cached.unlink(missing_ok=True)
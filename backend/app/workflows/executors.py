@@ -3,12 +3,15 @@ Executors for the RFP Builder workflow.
 Each executor handles a specific stage of the RFP generation process.
 """
 
+import io
 import json
 import logging
 import os
 import re
+import shutil
 import subprocess
 import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -900,14 +903,15 @@ class CritiquerExecutor(BaseExecutor):
 class CodeInterpreterExecutor(BaseExecutor):
     """Executor that runs document code to generate the final Word document."""
     
+    # Concurrent mmdc processes used by render_mermaid_batch/submit_mermaid
+    MERMAID_BATCH_WORKERS = 4
+    
     def __init__(self, client: Optional[AsyncOpenAI] = None, run_dir: Optional[Path] = None, output_dir: Optional[Path] = None):
         super().__init__(client, run_dir)
         self.output_dir = output_dir or Path("./output")
     
     def _find_mmdc(self) -> Optional[str]:
         """Find the mermaid CLI executable."""
-        import shutil
-        
         # Try to find mmdc in PATH
         mmdc = shutil.which('mmdc')
         if mmdc:
@@ -930,6 +934,13 @@ class CodeInterpreterExecutor(BaseExecutor):
         
         return None
     
+    @staticmethod
+    def _save_document(doc, docx_path: Path) -> None:
+        """Serialize the document in memory and write the .docx in a single call."""
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        docx_path.write_bytes(buffer.getvalue())
+    
     async def execute(
         self,
         response: RFPResponse,
@@ -952,6 +963,7 @@ class CodeInterpreterExecutor(BaseExecutor):
         import matplotlib
         matplotlib.use('Agg')  # Non-interactive backend
         import matplotlib.pyplot as plt
+        plt.ioff()  # No implicit redraws, even if matplotlibrc turns interactive mode on
         import seaborn as sns
         import numpy as np
         import pandas as pd
@@ -959,6 +971,19 @@ class CodeInterpreterExecutor(BaseExecutor):
         from docx.shared import Inches, Pt, Cm
         from docx.enum.text import WD_ALIGN_PARAGRAPH
         from docx.enum.table import WD_TABLE_ALIGNMENT
+        from app.services.docx_runtime import (
+            CHART_FIGURE,
+            RUNTIME_CONSTANTS,
+            MermaidCache,
+            SharedFigure,
+            add_data_table,
+            add_paragraphs,
+            add_section,
+            add_table_rows,
+            bold_cells,
+            save_chart,
+            set_header_cells,
+        )
         
         img_dir = image_dir or self.output_dir
         img_dir = Path(img_dir)
@@ -979,6 +1004,17 @@ class CodeInterpreterExecutor(BaseExecutor):
         
         # Find mmdc path
         mmdc_path = self._find_mmdc()
+        mermaid_cache = MermaidCache(Path(self.config.app.output_dir).parent / "mermaid_cache")
+        # Images are written to a local scratch directory during execution and
+        # copied to img_dir in one pass afterwards, keeping per-chart writes off
+        # slow (e.g. network-mounted) output storage.
+        staging_dir = Path(tempfile.mkdtemp(prefix="rfp_images_"))
+        # Mermaid renders are mostly headless-browser startup; this pool lets them
+        # run while the rest of the document is being built.
+        mermaid_pool = ThreadPoolExecutor(
+            max_workers=self.MERMAID_BATCH_WORKERS,
+            thread_name_prefix="mermaid",
+        )
         
         try:
             # Create the document
@@ -995,17 +1031,22 @@ class CodeInterpreterExecutor(BaseExecutor):
                 """Render mermaid diagram and return the image path.
 
                 Width/height/scale defaults are tuned to avoid clipped or oversized diagrams.
+                Identical diagrams are served from the content-hash cache without invoking mmdc.
                 """
-                if not mmdc_path:
-                    raise RuntimeError("Mermaid CLI (mmdc) not found. Install with: npm install -g @mermaid-js/mermaid-cli")
-                
-                mmd_file = img_dir / f"{output_filename}.mmd"
+                mmd_file = staging_dir / f"{output_filename}.mmd"
                 mmd_file.write_text(mermaid_code, encoding='utf-8')
-                png_path = img_dir / f"{output_filename}.png"
+                png_path = staging_dir / f"{output_filename}.png"
 
                 safe_width = max(800, min(int(width), 2400))
                 safe_height = max(600, min(int(height), 1800))
                 safe_scale = max(1.0, min(float(scale), 3.0))
+
+                cache_key = MermaidCache.key(mermaid_code, safe_width, safe_height, safe_scale)
+                if mermaid_cache.fetch(cache_key, png_path):
+                    return png_path
+
+                if not mmdc_path:
+                    raise RuntimeError("Mermaid CLI (mmdc) not found. Install with: npm install -g @mermaid-js/mermaid-cli")
                 
                 result = subprocess.run(
                     [
@@ -1028,7 +1069,38 @@ class CodeInterpreterExecutor(BaseExecutor):
                 )
                 if result.returncode != 0:
                     raise RuntimeError(f"Mermaid failed: {result.stderr}")
+                mermaid_cache.store(cache_key, png_path)
                 return png_path
+
+            def render_mermaid_batch(
+                diagrams: list[tuple[str, str]],
+                width: int = 1600,
+                height: int = 1000,
+                scale: float = 1.5,
+            ) -> list[Path]:
+                """Render several (mermaid_code, output_filename) pairs and return their paths in order.
+
+                Each mmdc call spends most of its time starting a headless browser, so the
+                renders run side by side and the batch costs roughly one render.
+                """
+                if len(diagrams) <= 1:
+                    return [render_mermaid(code, name, width, height, scale) for code, name in diagrams]
+                futures = [submit_mermaid(code, name, width, height, scale) for code, name in diagrams]
+                return [future.result() for future in futures]
+
+            def submit_mermaid(
+                mermaid_code: str,
+                output_filename: str,
+                width: int = 1600,
+                height: int = 1000,
+                scale: float = 1.5,
+            ) -> Future:
+                """Start rendering a mermaid diagram in the background and return a Future of its path.
+
+                Call ``.result()`` where the picture is inserted so the render overlaps with
+                the document code in between.
+                """
+                return mermaid_pool.submit(render_mermaid, mermaid_code, output_filename, width, height, scale)
             
             # Create execution environment with everything the LLM needs
             exec_globals = {
@@ -1036,7 +1108,7 @@ class CodeInterpreterExecutor(BaseExecutor):
                 "__builtins__": __builtins__,
                 # Document
                 "doc": doc,
-                "output_dir": img_dir,  # For generated images/charts
+                "output_dir": staging_dir,  # For generated images/charts (copied to img_dir)
                 # python-docx
                 "Inches": Inches,
                 "Pt": Pt,
@@ -1055,17 +1127,28 @@ class CodeInterpreterExecutor(BaseExecutor):
                 "Path": Path,
                 # Mermaid helper
                 "render_mermaid": render_mermaid,
+                "render_mermaid_batch": render_mermaid_batch,
+                "submit_mermaid": submit_mermaid,
                 "mmdc_path": mmdc_path,
+                # Batched paragraph/table helpers
+                "add_paragraphs": add_paragraphs,
+                "add_section": add_section,
+                "add_data_table": add_data_table,
+                "add_table_rows": add_table_rows,
+                "bold_cells": bold_cells,
+                "set_header_cells": set_header_cells,
+                # Chart helpers (one reusable figure shared by every build)
+                "chart_subplots": CHART_FIGURE.subplots,
+                "save_chart": save_chart,
+                # Precomputed measurements/alignments
+                **RUNTIME_CONSTANTS,
             }
             
             # Execute the document code
             exec(response.document_code, exec_globals)
             
-            # Close any open matplotlib figures
-            plt.close('all')
-            
             # Save the document
-            doc.save(docx_path)
+            self._save_document(doc, docx_path)
             stats["document_success"] = True
             logger.info(f"Document saved to {docx_path}")
             
@@ -1080,7 +1163,17 @@ class CodeInterpreterExecutor(BaseExecutor):
             doc.add_paragraph(f"Error: {str(e)}")
             doc.add_heading("Generated Code", level=1)
             doc.add_paragraph(response.document_code[:5000])  # First 5000 chars
-            doc.save(docx_path)
+            self._save_document(doc, docx_path)
+        finally:
+            mermaid_pool.shutdown(wait=True, cancel_futures=True)
+            # Close the figures the document code opened itself; the shared chart
+            # figure is only cleared so the next build reuses it.
+            for num, label in zip(plt.get_fignums(), plt.get_figlabels()):
+                if label != SharedFigure.NUM:
+                    plt.close(num)
+            CHART_FIGURE.reset()
+            shutil.copytree(staging_dir, img_dir, dirs_exist_ok=True)
+            shutil.rmtree(staging_dir, ignore_errors=True)
         
         logger.info(f"Code interpreter complete: {'success' if stats['document_success'] else 'failed'}")
         
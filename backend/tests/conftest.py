@@ -0,0 +1,19 @@
+"""Shared pytest fixtures for the backend tests."""
+
+from pathlib import Path
+
+import pytest
+
+from app.core import config as config_module
+from app.core.config import load_config
+
+EXAMPLE_CONFIG = Path(__file__).resolve().parents[2] / "config.toml.example"
+
+
+@pytest.fixture
+def app_config(tmp_path, monkeypatch):
+    """Install the example configuration, with outputs redirected to a temp directory."""
+    config = load_config(EXAMPLE_CONFIG)
+    config.app.output_dir = str(tmp_path / "outputs" / "runs")
+    monkeypatch.setattr(config_module, "_config", config)
+    return config
@@ -0,0 +1,38 @@
+"""Tests for the document runtime helpers."""
+
+import pytest
+from docx import Document
+
+from app.services.docx_runtime import add_paragraphs, add_table_rows
+
+TEXTS = [
+    "Scope\r\nDelivery",
+    "Name:\tValue",
+    "line one\nline two\rline three",
+    "  padded  ",
+    "A & B <C>",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_add_paragraphs_matches_add_paragraph(text):
+    expected = Document().add_paragraph(text, style="List Bullet")
+    (paragraph,) = add_paragraphs(Document(), [text], style="List Bullet")
+    assert paragraph._p.xml == expected._p.xml
+
+
+def test_crlf_gives_two_breaks_like_run_text():
+    (paragraph,) = add_paragraphs(Document(), ["a\r\nb\tc"])
+    run = paragraph._p.r_lst[0]
+    assert [child.tag.rsplit("}", 1)[1] for child in run] == ["t", "br", "br", "t", "tab", "t"]
+    assert paragraph.text == Document().add_paragraph("a\r\nb\tc").text
+
+
+def test_add_table_rows_matches_cell_text():
+    expected = Document().add_table(rows=0, cols=2)
+    cells = expected.add_row().cells
+    cells[0].text, cells[1].text = TEXTS[0], TEXTS[1]
+
+    table = Document().add_table(rows=0, cols=2)
+    add_table_rows(table, [TEXTS[:2]])
+    assert table._tbl.tr_lst[0].xml == expected._tbl.tr_lst[0].xml
@@ -0,0 +1,38 @@
+"""Tests for the code interpreter executor."""
+
+import asyncio
+
+import matplotlib.pyplot as plt
+
+from app.models.schemas import RFPResponse
+from app.services.docx_runtime import CHART_FIGURE, SharedFigure
+from app.workflows.executors import CodeInterpreterExecutor
+
+CHART_CODE = """
+fig, ax = chart_subplots(figsize=(6, 3.5))
+ax.bar(['Discover', 'Build', 'Run'], [4, 9, 5])
+doc.add_picture(save_chart(fig, output_dir / 'staffing_by_phase.png'), width=FIGURE_WIDTH)
+extra_fig, extra_ax = plt.subplots()
+"""
+
+
+def test_chart_figure_is_reused_across_builds(app_config, tmp_path, monkeypatch):
+    figures = []
+    subplots = CHART_FIGURE.subplots
+
+    def recording_subplots(*args, **kwargs):
+        fig, ax = subplots(*args, **kwargs)
+        figures.append(fig)
+        return fig, ax
+
+    monkeypatch.setattr(CHART_FIGURE, "subplots", recording_subplots)
+    executor = CodeInterpreterExecutor(client=object(), output_dir=tmp_path / "run")
+    for _ in range(2):
+        _, stats = asyncio.run(executor.execute(RFPResponse(document_code=CHART_CODE)))
+        assert stats["document_success"], stats["errors"]
+
+    first, second = figures
+    assert first is second
+    # Figures opened by the document code are closed; the shared one is only cleared.
+    assert plt.get_figlabels() == [SharedFigure.NUM]
+    assert not first.axes
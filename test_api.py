@@ -8,84 +8,117 @@ Tests the complete workflow including:
 - Review and revision loop
 """
 
+import os
 import requests
 import json
 import time
+from contextlib import ExitStack
 from pathlib import Path
+from typing import Optional
 
 # Configuration
 API_BASE_URL = "http://127.0.0.1:8000"
-EXAMPLES_DIR = Path(__file__).parent / "examples"
+HEALTH_CHECK_ATTEMPTS = 5
+HEALTH_CHECK_BACKOFF = 0.2  # seconds before the first retry, doubled after each one
+HEALTH_CHECK_RETRY_STATUSES = {502, 503, 504}  # gateway/proxy replies while the app is still starting
+PROJECT_DIR = Path(__file__).parent
+EXAMPLES_DIR = PROJECT_DIR / "examples"
+OUTPUTS_DIR = PROJECT_DIR / "backend" / "outputs"
+OUTPUT_JSON = PROJECT_DIR / "test_output.json"
+OUTPUT_MD = PROJECT_DIR / "test_output.md"
+
+# Console section separators
+BANNER = "=" * 60
+RULE = "-" * 60
+PREVIEW_RULE = "-" * 50
 
 # File paths
 RFP_TO_ANSWER = EXAMPLES_DIR / "rfp_to_answer" / "RFP-2022-01-LaSalle-SSES-Engineering-Services-Phase-1.pdf"
 PAST_RFP = EXAMPLES_DIR / "past_rfps" / "RFP_Response.pdf"
 INTERNAL_DOC = EXAMPLES_DIR / "internal_capabilties" / "Internal_Capabilities_Overview.pdf"
 
+# (label, form field, path) for each uploaded example file
+UPLOADS = (
+    ("RFP to Answer", "rfp", RFP_TO_ANSWER),
+    ("Past RFP", "example_rfps", PAST_RFP),
+    ("Internal Doc", "company_context", INTERNAL_DOC),
+)
+
 
-def test_health_check():
+def test_health_check(session: Optional[requests.Session] = None):
     """Test that the API is running"""
-    print("\n" + "="*60)
+    session = session or requests.Session()
+    print("\n" + BANNER)
     print("Testing API Health Check...")
-    print("="*60)
+    print(BANNER)
     
-    try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=10)
+    # Short timeouts with exponential backoff: a server that is still starting is
+    # picked up within a few hundred ms, a dead one fails in about 3 seconds
+    delay = HEALTH_CHECK_BACKOFF
+    for attempt in range(1, HEALTH_CHECK_ATTEMPTS + 1):
+        try:
+            response = session.get(f"{API_BASE_URL}/health", timeout=(1, 2))
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if attempt == HEALTH_CHECK_ATTEMPTS:
+                print("[FAIL] Cannot connect to API. Is the server running?")
+                return False
+            time.sleep(delay)
+            delay *= 2
+            continue
+        
+        if response.status_code in HEALTH_CHECK_RETRY_STATUSES and attempt < HEALTH_CHECK_ATTEMPTS:
+            time.sleep(delay)
+            delay *= 2
+            continue
         if response.status_code == 200:
             print("[OK] API is healthy!")
             print(f"   Response: {response.json()}")
             return True
-        else:
-            print(f"[FAIL] API health check failed: {response.status_code}")
-            return False
-    except requests.exceptions.ConnectionError:
-        print("[FAIL] Cannot connect to API. Is the server running?")
+        print(f"[FAIL] API health check failed: {response.status_code}")
         return False
 
 
-def test_rfp_workflow():
+def test_rfp_workflow(session: Optional[requests.Session] = None):
     """Test the complete RFP workflow"""
-    print("\n" + "="*60)
+    session = session or requests.Session()
+    print("\n" + BANNER)
     print("Testing RFP Workflow...")
-    print("="*60)
+    print(BANNER)
     
     # Check files exist
     print("\nChecking example files...")
-    for name, path in [("RFP to Answer", RFP_TO_ANSWER), 
-                       ("Past RFP", PAST_RFP), 
-                       ("Internal Doc", INTERNAL_DOC)]:
-        if path.exists():
+    missing = False
+    for name, _, path in UPLOADS:
+        if path.is_file():
             print(f"   [OK] {name}: {path.name}")
         else:
             print(f"   [FAIL] {name} not found: {path}")
-            return None
+            missing = True
+    if missing:
+        return None
     
     # Prepare multipart form data
     print("\nUploading files to API...")
     
-    files = []
     try:
-        # Open files for multipart upload
-        rfp_file = open(RFP_TO_ANSWER, 'rb')
-        past_rfp_file = open(PAST_RFP, 'rb')
-        internal_file = open(INTERNAL_DOC, 'rb')
-        
-        files = [
-            ('rfp', (RFP_TO_ANSWER.name, rfp_file, 'application/pdf')),
-            ('example_rfps', (PAST_RFP.name, past_rfp_file, 'application/pdf')),
-            ('company_context', (INTERNAL_DOC.name, internal_file, 'application/pdf')),
-        ]
-        
-        # Make API request
-        print("   Sending request to /api/rfp/generate...")
-        print("   [WAIT] This may take several minutes...")
-        
-        start_time = time.time()
-        response = requests.post(
-            f"{API_BASE_URL}/api/rfp/generate",
-            files=files,
-            timeout=600  # 10 minute timeout
-        )
+        with ExitStack() as stack:
+            # Open files for multipart upload; the stack closes them once the request
+            # has been sent, or right away if a later open fails
+            files = [
+                (field, (path.name, stack.enter_context(open(path, 'rb')), 'application/pdf'))
+                for _, field, path in UPLOADS
+            ]
+            
+            # Make API request
+            print("   Sending request to /api/rfp/generate...")
+            print("   [WAIT] This may take several minutes...")
+            
+            start_time = time.time()
+            response = session.post(
+                f"{API_BASE_URL}/api/rfp/generate",
+                files=files,
+                timeout=600  # 10 minute timeout
+            )
         elapsed = time.time() - start_time
         
         print(f"\n   Request completed in {elapsed:.1f} seconds")
@@ -104,20 +137,13 @@ def test_rfp_workflow():
     except Exception as e:
         print(f"   [FAIL] Error: {e}")
         return None
-    finally:
-        # Close files
-        for f in files:
-            try:
-                f[1][1].close()
-            except:
-                pass
 
 
 def analyze_result(result: dict):
     """Analyze the workflow result"""
-    print("\n" + "="*60)
+    print("\n" + BANNER)
     print("Analyzing Workflow Result...")
-    print("="*60)
+    print(BANNER)
     
     if not result:
         print("[FAIL] No result to analyze")
@@ -140,7 +166,7 @@ def analyze_result(result: dict):
         
         # Show first 2000 chars of response
         print("\nResponse Preview (first 2000 chars):")
-        print("-"*50)
+        print(PREVIEW_RULE)
         print(response[:2000])
         if len(response) > 2000:
             print(f"\n... [{len(response) - 2000} more characters]")
@@ -160,49 +186,45 @@ def analyze_result(result: dict):
         print(f"   Total time: {meta.get('total_time', 'N/A')}")
     
     # Save full result to file
-    output_file = Path(__file__).parent / "test_output.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
+    with open(OUTPUT_JSON, 'w', encoding='utf-8') as f:
         json.dump(result, f, indent=2, ensure_ascii=False)
-    print(f"\nFull result saved to: {output_file}")
+    print(f"\nFull result saved to: {OUTPUT_JSON}")
     
     # Save response as markdown
     if 'response' in result:
-        md_file = Path(__file__).parent / "test_output.md"
-        with open(md_file, 'w', encoding='utf-8') as f:
+        with open(OUTPUT_MD, 'w', encoding='utf-8') as f:
             f.write(result['response'])
-        print(f"Response saved to: {md_file}")
+        print(f"Response saved to: {OUTPUT_MD}")
 
 
 def check_logs():
     """Check the logs directory for output"""
-    print("\n" + "="*60)
+    print("\n" + BANNER)
     print("Checking Log Files...")
-    print("="*60)
-    
-    logs_dir = Path(__file__).parent / "backend" / "outputs"
+    print(BANNER)
     
-    if not logs_dir.exists():
+    if not OUTPUTS_DIR.exists():
         print(f"[WARN] Outputs directory not found. Will be created on first API call.")
         return
     
     # Find most recent run
-    runs_dir = logs_dir / "runs"
+    runs_dir = OUTPUTS_DIR / "runs"
     if not runs_dir.exists():
         print("[WARN] No runs directory found yet.")
         return
     
-    sessions = sorted(runs_dir.iterdir(), reverse=True)
+    # Run directories are timestamp-named, so the newest is the greatest name (one pass, no sort)
+    latest_session = max(runs_dir.iterdir(), key=lambda path: path.name, default=None)
     
-    if not sessions:
+    if latest_session is None:
         print("[WARN] No log sessions found yet.")
         return
     
-    latest_session = sessions[0]
     print(f"\nLatest session: {latest_session.name}")
     
     # Show directory structure
     print("\nEnterprise Directory Structure:")
-    print("-"*60)
+    print(RULE)
     
     subdirs_info = {
         "word_document": "Final .docx proposal",
@@ -214,10 +236,15 @@ def check_logs():
         "code_snapshots": "Generated code evolution"
     }
     
+    # One scandir of the session gives every subdirectory with its type already known
+    with os.scandir(latest_session) as entries:
+        present = {entry.name: entry.path for entry in entries if entry.is_dir(follow_symlinks=False)}
+    
     for subdir_name, description in subdirs_info.items():
-        subdir = latest_session / subdir_name
-        if subdir.exists():
-            count = len(list(subdir.glob("*")))
+        subdir_path = present.get(subdir_name)
+        if subdir_path is not None:
+            with os.scandir(subdir_path) as subdir_entries:
+                count = sum(1 for _ in subdir_entries)
             print(f"  {subdir_name}/")
             print(f"    Description: {description}")
             print(f"    Files: {count}")
@@ -234,20 +261,23 @@ def check_logs():
 
 
 def main():
-    print("\n" + "="*60)
+    print("\n" + BANNER)
     print("RFP BUILDER - End-to-End Test")
-    print("="*60)
+    print(BANNER)
     print(f"API URL: {API_BASE_URL}")
     print(f"Examples: {EXAMPLES_DIR}")
     
-    # Test 1: Health check
-    if not test_health_check():
-        print("\n[WARN] API not available. Please start the server first:")
-        print("   cd backend && python -m uvicorn app.main:app --reload")
-        return
-    
-    # Test 2: Run workflow
-    result = test_rfp_workflow()
+    # One session for all API calls, so the workflow request reuses the
+    # health check's keep-alive connection instead of opening a new one
+    with requests.Session() as session:
+        # Test 1: Health check
+        if not test_health_check(session):
+            print("\n[WARN] API not available. Please start the server first:")
+            print("   cd backend && python -m uvicorn app.main:app --reload")
+            return
+        
+        # Test 2: Run workflow
+        result = test_rfp_workflow(session)
     
     # Test 3: Analyze result
     analyze_result(result)
@@ -255,9 +285,9 @@ def main():
     # Test 4: Check logs
     check_logs()
     
-    print("\n" + "="*60)
+    print("\n" + BANNER)
     print("[OK] Test Complete!")
-    print("="*60)
+    print(BANNER)
     print("\nNext steps:")
     print("1. Check backend/outputs/runs/{latest_run}/ for all artifacts")
     print("2. Open word_document/proposal.docx to view the generated proposal")